@@ -0,0 +1,9 @@
+# Cython declarations for geokernel.py (pure-Python mode); see its docstring.
+from libc cimport math
+
+cdef double _R, _DEG2RAD
+
+cpdef double haversine_term(double lon1, double lat1, double lon2, double lat2)
+cpdef double haversine_term_cos(double lon1, double lat1, double lon2, double lat2, double cos_lat2)
+cpdef double haversine_meters(double lon1, double lat1, double lon2, double lat2)
+cpdef double meters_from_term(double a)
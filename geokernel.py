@@ -0,0 +1,48 @@
+"""Scalar great-circle kernels for the check-in path.
+
+This module is plain Python, written so Cython can compile it in pure-Python mode
+using the type declarations in geokernel.pxd:
+
+    pip install cython
+    cythonize -i geokernel.py
+
+The resulting extension module is imported in place of this file, running the
+same functions on C doubles and libm. Without it, everything works unchanged.
+"""
+import math
+
+# Mean Earth radius (IUGG) used by the haversine formula
+EARTH_RADIUS_METERS = 6371008.8
+_R = EARTH_RADIUS_METERS
+_DEG2RAD = 0.017453292519943295 # pi / 180
+
+
+def haversine_term(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Returns the haversine inner term `a` for two (longitude, latitude) pairs in degrees.
+
+    The distance is 2 * R * asin(sqrt(a)); since that is monotonic in `a`, range checks
+    can compare `a` against a precomputed threshold directly.
+    """
+    lat1 *= _DEG2RAD
+    lat2 *= _DEG2RAD
+    dlat = lat2 - lat1
+    dlon = (lon2 - lon1) * _DEG2RAD
+    return math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+
+
+def haversine_term_cos(lon1: float, lat1: float, lon2: float, lat2: float, cos_lat2: float) -> float:
+    """Same as haversine_term, with cos(lat2) supplied by the caller (e.g. cached per organization)."""
+    lat1 *= _DEG2RAD
+    dlat = lat2 * _DEG2RAD - lat1
+    dlon = (lon2 - lon1) * _DEG2RAD
+    return math.sin(dlat / 2) ** 2 + math.cos(lat1) * cos_lat2 * math.sin(dlon / 2) ** 2
+
+
+def haversine_meters(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Great-circle distance in meters between two (longitude, latitude) pairs in degrees."""
+    return 2 * _R * math.asin(math.sqrt(haversine_term(lon1, lat1, lon2, lat2)))
+
+
+def meters_from_term(a: float) -> float:
+    """Converts a haversine term (see haversine_term) into meters."""
+    return 2 * _R * math.asin(math.sqrt(a))
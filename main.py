@@ -1,20 +1,76 @@
+import os
+import time
 import uuid
 import datetime
-from typing import List, Dict, Tuple, Literal, Optional
+import functools
+import math
+from math import sin, cos, sqrt
+from collections import defaultdict
+from typing import Iterator, List, Dict, Tuple, Literal, Optional
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, Body, Path, status
+import msgspec
+import numpy as np
+import orjson
+from fastapi import FastAPI, HTTPException, Body, Path, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator
-from geopy.distance import geodesic # type: ignore # geopy doesn't have great type hints yet
+
+from geokernel import EARTH_RADIUS_METERS, haversine_meters, haversine_term_cos, meters_from_term
 
 # --- Configuration ---
 # Maximum distance in meters an employee can be from the organization to check in
 MAX_CHECKIN_DISTANCE_METERS = 1000 # 1 km - adjust as needed
 
+_DEG2RAD = math.pi / 180.0
+
+# WGS84 ellipsoid constants for the cheap-ruler approximation
+_WGS84_A_METERS = 6378137.0
+_WGS84_E2 = (1 / 298.257223563) * (2 - 1 / 298.257223563)
+# Check-ins farther than this (per the cheap ruler) are re-measured with haversine.
+# Kept squared so the comparison needs no sqrt.
+_RULER_FALLBACK_METERS_SQ = (0.9 * MAX_CHECKIN_DISTANCE_METERS) ** 2
+# Haversine inner term at exactly MAX_CHECKIN_DISTANCE_METERS; larger means too far
+_A_THRESHOLD = sin(MAX_CHECKIN_DISTANCE_METERS / (2 * EARTH_RADIUS_METERS)) ** 2
+
+# Records serialized per chunk when streaming GET /attendance
+_ATTENDANCE_STREAM_CHUNK = 1000
+
+# Check-in coordinates are quantized to 1e-5 degrees (~1 m) so repeated GPS fixes
+# from the same employee share a cached distance
+_CHECKIN_COORD_SCALE = 100000
+
+# Spatial grid for nearby-organization queries. Cells match a level-5 geohash
+# (12 latitude bits, 13 longitude bits: ~0.044 degrees, ~4.9 km along a meridian).
+_GRID_ROWS = 1 << 12
+_GRID_COLS = 1 << 13
+_GRID_CELL_DEG = 180.0 / _GRID_ROWS
+_GRID_CELL_METERS = _GRID_CELL_DEG * _DEG2RAD * EARTH_RADIUS_METERS
+# Largest radius accepted by GET /organizations/nearby
+NEARBY_MAX_RADIUS_METERS = 50000
+
 # --- In-Memory Storage (Replace with a database in a real application) ---
-organizations_db: Dict[UUID, 'Organization'] = {}
-employees_db: Dict[UUID, 'Employee'] = {}
-attendance_db: Dict[UUID, 'Attendance'] = {}
+# Stores are keyed by `UUID.int` rather than the UUID itself: UUID.__hash__ is a
+# Python-level method, while hashing the underlying int stays in C.
+organizations_db: Dict[int, 'Organization'] = {}
+employees_db: Dict[int, 'Employee'] = {}
+attendance_db: Dict[int, 'AttendanceRow'] = {}
+# Per-organization (longitude, latitude, kx, ky, cos(latitude)), precomputed at creation for the check-in path
+OrgGeometry = Tuple[float, float, float, float, float]
+_org_geometry: Dict[int, OrgGeometry] = {}
+# Per-employee (organization_id, organization geometry), filled at employee creation so a
+# check-in resolves everything it needs with a single lookup. Organizations cannot move
+# today; if that is ever supported, these entries must be refreshed alongside.
+_employee_checkin_cache: Dict[int, Tuple[UUID, OrgGeometry]] = {}
+# Packed (longitude, latitude) rows for bulk distance queries; only the first
+# len(_org_row) rows are in use, the rest is spare capacity.
+_org_coords: np.ndarray = np.empty((0, 2), dtype=np.float64)
+_org_row: Dict[int, int] = {}
+_org_by_row: List['Organization'] = []
+# Grid cell (row, col) -> packed rows of the organizations located in it
+_org_grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
 
 # --- GeoJSON Point Model ---
 # Q1: Part of the Organization model requirement
@@ -26,6 +82,8 @@ class GeoPoint(BaseModel):
     @validator('coordinates')
     def validate_coordinates(cls, v):
         longitude, latitude = v
+        if -180 <= longitude <= 180 and -90 <= latitude <= 90:
+            return v
         if not (-180 <= longitude <= 180):
             raise ValueError("Longitude must be between -180 and 180")
         if not (-90 <= latitude <= 90):
@@ -67,33 +125,260 @@ class CheckInRequest(BaseModel):
     employee_id: UUID
     location: GeoPoint
 
+# Output Models for Batch Check-in
+class CheckInRejection(BaseModel):
+    index: int # Position of the rejected check-in in the request body
+    employee_id: UUID
+    distance_meters: float
+
+class BatchCheckInResult(BaseModel):
+    accepted: List[Attendance]
+    rejected: List[CheckInRejection]
+
+# --- Batch Ingestion Structs ---
+# The batch endpoint decodes its body with msgspec, which parses and validates in C;
+# these mirror CheckInRequest/GeoPoint, which remain the documented schema.
+# Coordinate bounds are checked for the whole batch at once with numpy, see
+# validate_batch_coordinates.
+class GeoPointStruct(msgspec.Struct):
+    coordinates: Tuple[float, float] # (longitude, latitude)
+    type: Literal["Point"] = "Point"
+
+class CheckInStruct(msgspec.Struct):
+    employee_id: UUID
+    location: GeoPointStruct
+
+_check_in_batch_decoder = msgspec.json.Decoder(List[CheckInStruct])
+
+# --- Storage Records ---
+class AttendanceRow:
+    """Stored form of an attendance record.
+
+    A plain slotted object is far smaller than a Pydantic model with a per-instance
+    __dict__; the Attendance shape is only built when a record is returned.
+    """
+    __slots__ = ("id", "employee_id", "organization_id", "longitude", "latitude", "timestamp_us", "distance_meters")
+
+    def __init__(
+        self,
+        id: UUID,
+        employee_id: UUID,
+        organization_id: UUID,
+        longitude: float,
+        latitude: float,
+        timestamp_us: int, # UTC, microseconds since the UNIX epoch
+        distance_meters: float,
+    ):
+        self.id = id
+        self.employee_id = employee_id
+        self.organization_id = organization_id
+        self.longitude = longitude
+        self.latitude = latitude
+        self.timestamp_us = timestamp_us
+        self.distance_meters = distance_meters
+
 
 # --- FastAPI Application ---
 app = FastAPI(
     title="Employee Attendance API",
     description="API for managing organizations, employees, and attendance check-ins.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse # orjson renders UUID/datetime natively and much faster
 )
+# List endpoints return large, repetitive UUID-heavy payloads that compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # --- Helper Functions ---
 def get_employee_or_404(employee_id: UUID) -> Employee:
-    employee = employees_db.get(employee_id)
+    employee = employees_db.get(employee_id.int)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Employee with id {employee_id} not found")
     return employee
 
 def get_organization_or_404(org_id: UUID) -> Organization:
-    organization = organizations_db.get(org_id)
+    organization = organizations_db.get(org_id.int)
     if not organization:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Organization with id {org_id} not found")
     return organization
 
+def get_checkin_target_or_404(employee_key: int) -> Tuple[UUID, OrgGeometry]:
+    """Returns the employee's (organization_id, organization geometry) for check-in.
+
+    Takes the employee's UUID.int; a UUID object is only rebuilt for the 404 message.
+    """
+    cached = _employee_checkin_cache.get(employee_key)
+    if cached is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Employee with id {UUID(int=employee_key)} not found")
+    return cached
+
+def validate_batch_coordinates(coords: np.ndarray) -> None:
+    """Checks an (N, 2) array of (longitude, latitude) rows against GeoPoint's bounds.
+
+    Raises RequestValidationError naming the first offending item.
+    """
+    lons = coords[:, 0]
+    lats = coords[:, 1]
+    lon_ok = (lons >= -180) & (lons <= 180)
+    valid = lon_ok & (lats >= -90) & (lats <= 90)
+    if valid.all():
+        return
+    index = int(np.argmin(valid))
+    if not lon_ok[index]:
+        msg = "Longitude must be between -180 and 180"
+    else:
+        msg = "Latitude must be between -90 and 90"
+    raise RequestValidationError([{"type": "value_error", "loc": ("body", index, "location", "coordinates"), "msg": msg}])
+
+def uuid4_batch(count: int) -> List[UUID]:
+    """Generates `count` random (version 4) UUIDs from a single os.urandom read."""
+    random_bytes = os.urandom(16 * count)
+    return [UUID(bytes=random_bytes[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+# Naive UTC, matching the datetime.utcnow() timestamps of the Attendance model
+_UNIX_EPOCH = datetime.datetime(1970, 1, 1)
+
+def attendance_response(row: AttendanceRow) -> dict:
+    """Builds the Attendance response payload for a stored record."""
+    return {
+        "id": row.id,
+        "employee_id": row.employee_id,
+        "location": {"type": "Point", "coordinates": (row.longitude, row.latitude)},
+        "timestamp": _UNIX_EPOCH + datetime.timedelta(microseconds=row.timestamp_us),
+        "organization_id": row.organization_id,
+        "distance_meters": row.distance_meters,
+    }
+
+def stream_attendance_json(rows: List[AttendanceRow]) -> Iterator[bytes]:
+    """Yields a JSON array of Attendance payloads, serialized a chunk at a time."""
+    yield b"["
+    for start in range(0, len(rows), _ATTENDANCE_STREAM_CHUNK):
+        chunk = orjson.dumps([attendance_response(row) for row in rows[start:start + _ATTENDANCE_STREAM_CHUNK]])
+        if start:
+            yield b","
+        yield chunk[1:-1] # Drop the chunk's own brackets
+    yield b"]"
+
+def haversine_vec(lons1: np.ndarray, lats1: np.ndarray, lons2: np.ndarray, lats2: np.ndarray) -> np.ndarray:
+    """Vectorized haversine_meters over equal-length arrays of degrees; returns meters."""
+    lats1 = np.radians(lats1)
+    lats2 = np.radians(lats2)
+    dlat = lats2 - lats1
+    dlon = np.radians(lons2 - lons1)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lats1) * np.cos(lats2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(a))
+
 def calculate_distance_meters(point1: GeoPoint, point2: GeoPoint) -> float:
-    """Calculates geodesic distance between two GeoPoints in meters."""
-    # geopy expects (latitude, longitude)
-    coords1 = (point1.coordinates[1], point1.coordinates[0])
-    coords2 = (point2.coordinates[1], point2.coordinates[0])
-    return geodesic(coords1, coords2).meters
+    """Calculates great-circle (haversine) distance between two GeoPoints in meters."""
+    lon1, lat1 = point1.coordinates
+    lon2, lat2 = point2.coordinates
+    return haversine_meters(lon1, lat1, lon2, lat2)
+
+def cheap_ruler_factors(latitude: float) -> Tuple[float, float]:
+    """Returns (kx, ky), meters per degree of longitude/latitude at the given latitude.
+
+    Uses the WGS84 cheap-ruler approximation, which is accurate to well under 0.1%
+    over the short distances relevant to check-ins.
+    """
+    coslat = cos(latitude * _DEG2RAD)
+    w2 = 1 / (1 - _WGS84_E2 * (1 - coslat * coslat))
+    w = sqrt(w2)
+    m = _DEG2RAD * _WGS84_A_METERS
+    return m * w * coslat, m * w * w2 * (1 - _WGS84_E2)
+
+@functools.lru_cache(maxsize=65536)
+def checkin_distance(employee_key: int, lon_q: int, lat_q: int) -> Tuple[UUID, float, bool]:
+    """Returns (organization_id, distance_meters, too_far) for a quantized check-in.
+
+    `employee_key` is the employee's UUID.int and `lon_q`/`lat_q` are the coordinates
+    scaled by _CHECKIN_COORD_SCALE and rounded. The cheap ruler settles clearly
+    in-range check-ins; anything near or past the limit is decided on the exact
+    haversine term. Results are cached, so this must be cleared (cache_clear) if an
+    organization's location ever becomes mutable.
+    """
+    organization_id, (org_lon, org_lat, kx, ky, cos_org_lat) = get_checkin_target_or_404(employee_key)
+    longitude = lon_q / _CHECKIN_COORD_SCALE
+    latitude = lat_q / _CHECKIN_COORD_SCALE
+    dx = (longitude - org_lon) * kx
+    dy = (latitude - org_lat) * ky
+    distance_sq = dx * dx + dy * dy
+    if distance_sq <= _RULER_FALLBACK_METERS_SQ:
+        return organization_id, sqrt(distance_sq), False
+    a = haversine_term_cos(longitude, latitude, org_lon, org_lat, cos_org_lat)
+    return organization_id, meters_from_term(a), a > _A_THRESHOLD
+
+def store_organization_coordinates(org_id: UUID, longitude: float, latitude: float) -> int:
+    """Appends an organization's coordinates to the packed array, growing it geometrically.
+
+    Returns the row the coordinates were stored in.
+    """
+    global _org_coords
+    row = len(_org_row)
+    if row == len(_org_coords):
+        grown = np.empty((max(16, 2 * row), 2), dtype=np.float64)
+        grown[:row] = _org_coords[:row]
+        _org_coords = grown
+    _org_coords[row] = (longitude, latitude)
+    _org_row[org_id.int] = row
+    return row
+
+def grid_cell(longitude: float, latitude: float) -> Tuple[int, int]:
+    """Returns the (row, col) spatial grid cell containing a point."""
+    row = min(int((latitude + 90.0) / _GRID_CELL_DEG), _GRID_ROWS - 1)
+    col = int((longitude + 180.0) / _GRID_CELL_DEG) % _GRID_COLS
+    return row, col
+
+def index_organization(organization: Organization) -> None:
+    """Records the derived geometry, packed coordinates and grid cell of a new organization."""
+    longitude, latitude = organization.location.coordinates
+    _org_geometry[organization.id.int] = (
+        longitude, latitude, *cheap_ruler_factors(latitude), cos(latitude * _DEG2RAD)
+    )
+    row = store_organization_coordinates(organization.id, longitude, latitude)
+    _org_by_row.append(organization)
+    _org_grid[grid_cell(longitude, latitude)].append(row)
+
+def find_organizations_within(longitude: float, latitude: float, radius_m: float) -> List[Organization]:
+    """Returns the organizations within radius_m of a point, nearest first.
+
+    Only organizations in grid cells that can intersect the radius are measured. When
+    that window would probe more cells than there are organizations (large radius,
+    near the poles or a small dataset), every organization is measured instead.
+    """
+    count = len(_org_row)
+    row, col = grid_cell(longitude, latitude)
+    row_span = math.ceil(radius_m / _GRID_CELL_METERS)
+    row_lo = max(0, row - row_span)
+    row_hi = min(_GRID_ROWS - 1, row + row_span)
+    # Longitude cells narrow toward the poles, so size the column window for the most
+    # poleward latitude the search window reaches.
+    edge_lat = max(abs(row_lo * _GRID_CELL_DEG - 90.0), abs((row_hi + 1) * _GRID_CELL_DEG - 90.0))
+    edge_cos = cos(edge_lat * _DEG2RAD)
+    if edge_cos > 0:
+        col_span = math.ceil(radius_m / (_GRID_CELL_METERS * edge_cos)) + 1
+    else:
+        col_span = _GRID_COLS
+    col_count = min(2 * col_span + 1, _GRID_COLS)
+
+    if (row_hi - row_lo + 1) * col_count >= count:
+        rows = np.arange(count, dtype=np.intp)
+    else:
+        if col_count == _GRID_COLS:
+            cols = range(_GRID_COLS)
+        else:
+            cols = [(col + offset) % _GRID_COLS for offset in range(-col_span, col_span + 1)]
+        candidates: List[int] = []
+        for grid_row in range(row_lo, row_hi + 1):
+            for grid_col in cols:
+                bucket = _org_grid.get((grid_row, grid_col))
+                if bucket:
+                    candidates.extend(bucket)
+        rows = np.array(candidates, dtype=np.intp)
+
+    coords = _org_coords[rows]
+    distances = haversine_vec(longitude, latitude, coords[:, 0], coords[:, 1])
+    within = np.flatnonzero(distances <= radius_m)
+    nearest_first = within[np.argsort(distances[within], kind="stable")]
+    return [_org_by_row[i] for i in rows[nearest_first].tolist()]
 
 # --- API Endpoints ---
 
@@ -116,11 +401,13 @@ async def create_organization(org_data: OrganizationBase = Body(...)):
     - **name**: The name of the organization.
     - **location**: A GeoJSON Point object with 'type': 'Point' and 'coordinates': [longitude, latitude].
     """
-    new_org = Organization(**org_data.dict())
-    if new_org.id in organizations_db:
+    # Input is already validated; construct skips a second validation pass
+    new_org = Organization.construct(id=uuid.uuid4(), name=org_data.name, location=org_data.location)
+    if new_org.id.int in organizations_db:
          # Extremely unlikely with UUID4, but good practice
          raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Organization ID conflict")
-    organizations_db[new_org.id] = new_org
+    organizations_db[new_org.id.int] = new_org
+    index_organization(new_org)
     return new_org
 
 @app.get(
@@ -133,6 +420,25 @@ async def list_organizations():
     """Retrieves a list of all registered organizations."""
     return list(organizations_db.values())
 
+@app.get(
+    "/organizations/nearby",
+    response_model=List[Organization],
+    tags=["Organizations"],
+    summary="Find organizations near a location"
+)
+async def list_nearby_organizations(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search center"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude of the search center"),
+    radius_m: float = Query(
+        MAX_CHECKIN_DISTANCE_METERS, gt=0, le=NEARBY_MAX_RADIUS_METERS,
+        description="Search radius in meters"
+    )
+):
+    """
+    Retrieves the organizations within `radius_m` meters of the given point, nearest first.
+    """
+    return find_organizations_within(lon, lat, radius_m)
+
 
 # Q4: POST /attendance/checkin -> Employee checks in
 @app.post(
@@ -151,17 +457,16 @@ async def check_in(check_in_data: CheckInRequest = Body(...)):
     - **employee_id**: The UUID of the employee checking in.
     - **location**: The employee's current location as a GeoJSON Point.
     """
-    # 1. Find the employee
-    employee = get_employee_or_404(check_in_data.employee_id)
-
-    # 2. Find the employee's organization
-    organization = get_organization_or_404(employee.organization_id)
-
-    # 3. Calculate distance
-    distance = calculate_distance_meters(check_in_data.location, organization.location)
+    # 1. Find the employee's organization and the distance to it (cached per ~1 m fix)
+    longitude, latitude = check_in_data.location.coordinates
+    organization_id, distance, too_far = checkin_distance(
+        check_in_data.employee_id.int,
+        round(longitude * _CHECKIN_COORD_SCALE),
+        round(latitude * _CHECKIN_COORD_SCALE),
+    )
 
-    # 4. Validate distance
-    if distance > MAX_CHECKIN_DISTANCE_METERS:
+    # 2. Validate distance
+    if too_far:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -170,19 +475,98 @@ async def check_in(check_in_data: CheckInRequest = Body(...)):
             )
         )
 
-    # 5. Create and store attendance record
-    attendance_record = Attendance(
-        employee_id=employee.id,
-        location=check_in_data.location,
-        organization_id=organization.id, # Store org for context
+    # 3. Create and store attendance record
+    attendance_record = AttendanceRow(
+        id=uuid.uuid4(),
+        employee_id=check_in_data.employee_id,
+        organization_id=organization_id, # Store org for context
+        longitude=longitude,
+        latitude=latitude,
+        timestamp_us=time.time_ns() // 1000,
         distance_meters=round(distance, 2) # Store distance for context
     )
-    if attendance_record.id in attendance_db:
+    if attendance_record.id.int in attendance_db:
          # Extremely unlikely with UUID4, but good practice
          raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Attendance record ID conflict")
 
-    attendance_db[attendance_record.id] = attendance_record
-    return attendance_record
+    attendance_db[attendance_record.id.int] = attendance_record
+    return attendance_response(attendance_record)
+
+@app.post(
+    "/attendance/checkin/batch",
+    response_model=BatchCheckInResult,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Attendance"],
+    summary="Record a batch of employee check-ins",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/CheckInRequest"}}
+                }
+            },
+        }
+    }
+)
+async def check_in_batch(request: Request):
+    """
+    Records several check-ins in one request. All distances are computed in a single
+    vectorized pass, and each check-in is accepted or rejected independently.
+
+    - **body**: A list of check-in requests, each with an employee_id and location.
+
+    Returns the stored attendance records and, for check-ins that were too far from
+    the organization, their index in the request and measured distance. An unknown
+    employee fails the whole batch with 404 and nothing is stored.
+    """
+    try:
+        check_ins = _check_in_batch_decoder.decode(await request.body())
+    except msgspec.DecodeError as exc:
+        # Report it the same way FastAPI reports invalid request bodies
+        raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(exc)}])
+
+    emp_coords = np.array(
+        [item.location.coordinates for item in check_ins], dtype=np.float64
+    ).reshape(-1, 2)
+    validate_batch_coordinates(emp_coords)
+
+    # 1. Resolve every employee and their organization's row in the packed coordinates
+    employees = [get_employee_or_404(item.employee_id) for item in check_ins]
+    org_coords = _org_coords[
+        np.array([_org_row[employee.organization_id.int] for employee in employees], dtype=np.intp)
+    ]
+
+    # 2. Calculate all distances at once
+    distances = haversine_vec(emp_coords[:, 0], emp_coords[:, 1], org_coords[:, 0], org_coords[:, 1])
+    within_range = (distances <= MAX_CHECKIN_DISTANCE_METERS).tolist()
+
+    # 3. Store the check-ins that are close enough, report the rest
+    accepted: List[dict] = []
+    rejected: List[CheckInRejection] = []
+    new_ids = iter(uuid4_batch(sum(within_range)))
+    for index, (item, employee, distance, ok) in enumerate(
+        zip(check_ins, employees, distances.tolist(), within_range)
+    ):
+        if not ok:
+            rejected.append(CheckInRejection(
+                index=index, employee_id=employee.id, distance_meters=round(distance, 2)
+            ))
+            continue
+        longitude, latitude = item.location.coordinates
+        attendance_record = AttendanceRow(
+            id=next(new_ids),
+            employee_id=employee.id,
+            organization_id=employee.organization_id,
+            longitude=longitude,
+            latitude=latitude,
+            timestamp_us=time.time_ns() // 1000,
+            distance_meters=round(distance, 2)
+        )
+        attendance_db[attendance_record.id.int] = attendance_record
+        accepted.append(attendance_response(attendance_record))
+
+    return {"accepted": accepted, "rejected": rejected}
 
 @app.get(
     "/attendance",
@@ -192,7 +576,10 @@ async def check_in(check_in_data: CheckInRequest = Body(...)):
 )
 async def list_attendance():
     """Retrieves a list of all attendance check-in records."""
-    return list(attendance_db.values())
+    # Streamed so large result sets are never built as one response list; the
+    # snapshot keeps concurrent check-ins from mutating the dict mid-stream.
+    rows = list(attendance_db.values())
+    return StreamingResponse(stream_attendance_json(rows), media_type="application/json")
 
 
 # Q5: GET /employees/{employee_id} -> Get employee details
@@ -228,13 +615,16 @@ async def create_employee(employee_data: EmployeeBase = Body(...)):
     - **organization_id**: The UUID of the organization the employee belongs to.
     """
     # Check if organization exists
-    get_organization_or_404(employee_data.organization_id)
+    organization = get_organization_or_404(employee_data.organization_id)
 
-    new_employee = Employee(**employee_data.dict())
-    if new_employee.id in employees_db:
+    new_employee = Employee.construct(
+        id=uuid.uuid4(), name=employee_data.name, organization_id=employee_data.organization_id
+    )
+    if new_employee.id.int in employees_db:
          # Extremely unlikely with UUID4, but good practice
          raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Employee ID conflict")
-    employees_db[new_employee.id] = new_employee
+    employees_db[new_employee.id.int] = new_employee
+    _employee_checkin_cache[new_employee.id.int] = (organization.id, _org_geometry[organization.id.int])
     return new_employee
 
 @app.get(
@@ -251,4 +641,6 @@ async def list_employees():
 # --- How to Run ---
 # Save the code as main.py
 # Run in terminal: uvicorn main:app --reload
+# In production: uvicorn main:app --loop uvloop --http httptools
+# (keep a single worker: the in-memory stores are not shared between processes)
 # Open browser to http://127.0.0.1:8000/docs for interactive API documentation.
\ No newline at end of file